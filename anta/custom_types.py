@@ -34,6 +34,15 @@ REGEX_BGP_IPV4_MPLS_VPN = r"\b(ipv4[\s\-]?mpls[\s\-]?vpn)\b"
 REGEX_BGP_IPV4_UNICAST = r"\b(ipv4[\s\-]?uni[\s\-]?cast)\b"
 """Match IPv4 Unicast."""
 
+# Compiled once as these patterns are used by validators running on every input
+_INTERFACE_ID_RE = re.compile(REGEXP_INTERFACE_ID)
+_BGP_MULTIPROTOCOL_CAPABILITIES = {
+    re.compile(REGEXP_BGP_L2VPN_AFI, re.IGNORECASE): "l2VpnEvpn",
+    re.compile(REGEXP_BGP_IPV4_MPLS_LABELS, re.IGNORECASE): "ipv4MplsLabels",
+    re.compile(REGEX_BGP_IPV4_MPLS_VPN, re.IGNORECASE): "ipv4MplsVpn",
+    re.compile(REGEX_BGP_IPV4_UNICAST, re.IGNORECASE): "ipv4Unicast",
+}
+
 
 def aaa_group_prefix(v: str) -> str:
     """Prefix the AAA method with 'group' if it is known."""
@@ -49,8 +58,7 @@ def interface_autocomplete(v: str) -> str:
          - `po` will be changed to `Port-Channel`
     - `lo` will be changed to `Loopback`
     """
-    intf_id_re = re.compile(REGEXP_INTERFACE_ID)
-    m = intf_id_re.search(v)
+    m = _INTERFACE_ID_RE.search(v)
     if m is None:
         msg = f"Could not parse interface ID in interface '{v}'"
         raise ValueError(msg)
@@ -87,16 +95,8 @@ def bgp_multiprotocol_capabilities_abbreviations(value: str) -> str:
         - ipv4Mplsvpn
 
     """
-    patterns = {
-        REGEXP_BGP_L2VPN_AFI: "l2VpnEvpn",
-        REGEXP_BGP_IPV4_MPLS_LABELS: "ipv4MplsLabels",
-        REGEX_BGP_IPV4_MPLS_VPN: "ipv4MplsVpn",
-        REGEX_BGP_IPV4_UNICAST: "ipv4Unicast",
-    }
-
-    for pattern, replacement in patterns.items():
-        match = re.search(pattern, value, re.IGNORECASE)
-        if match:
+    for pattern, replacement in _BGP_MULTIPROTOCOL_CAPABILITIES.items():
+        if pattern.search(value):
             return replacement
 
     return value
@@ -18,9 +18,32 @@ from anta import GITHUB_SUGGESTION
 from anta.custom_types import EthernetInterface, Interface, Percent, PositiveInteger
 from anta.decorators import skip_on_platforms
 from anta.models import AntaCommand, AntaTemplate, AntaTest
-from anta.tools import custom_division, get_failed_logs, get_item, get_value
+from anta.tools import get_failed_logs, get_item, get_value
 
 BPS_GBPS_CONVERSIONS = 1000000000
+_L2_INTERFACE_RE = re.compile(r"^[e,p][a-zA-Z]+[-,a-zA-Z]*\d+\/*\d*", re.IGNORECASE)
+
+
+def _alpha_prefix(interface: str) -> str:
+    """Return the leading alphabetic characters of an interface name.
+
+    Example:
+    -------
+        Ethernet1/1 -> Ethernet
+        Port-Channel10 -> Port
+
+    """
+    i = 0
+    n = len(interface)
+    while i < n and interface[i].isalpha():
+        i += 1
+    return interface[:i]
+
+
+def _to_gbps(speed: float) -> int | float:
+    """Convert a speed in bps to Gbps, returning an integer when the conversion is exact."""
+    quotient, remainder = divmod(speed, BPS_GBPS_CONVERSIONS)
+    return int(quotient) if remainder == 0 else speed / BPS_GBPS_CONVERSIONS
 
 
 class VerifyInterfaceUtilization(AntaTest):
@@ -65,6 +88,7 @@ class VerifyInterfaceUtilization(AntaTest):
         failed_interfaces: dict[str, dict[str, float]] = {}
         rates = self.instance_commands[0].json_output
         interfaces = self.instance_commands[1].json_output
+        threshold = self.inputs.threshold
 
         for intf, rate in rates["interfaces"].items():
             # The utilization logic has been implemented for full-duplex interfaces only
@@ -80,13 +104,13 @@ class VerifyInterfaceUtilization(AntaTest):
 
             for bps_rate in ("inBpsRate", "outBpsRate"):
                 usage = rate[bps_rate] / bandwidth * 100
-                if usage > self.inputs.threshold:
+                if usage > threshold:
                     failed_interfaces.setdefault(intf, {})[bps_rate] = usage
 
         if not failed_interfaces:
             self.result.is_success()
         else:
-            self.result.is_failure(f"The following interfaces have a usage > {self.inputs.threshold}%: {failed_interfaces}")
+            self.result.is_failure(f"The following interfaces have a usage > {threshold}%: {failed_interfaces}")
 
 
 class VerifyInterfaceErrors(AntaTest):
@@ -114,10 +138,9 @@ class VerifyInterfaceErrors(AntaTest):
     def test(self) -> None:
         """Main test function for VerifyInterfaceErrors."""
         command_output = self.instance_commands[0].json_output
-        wrong_interfaces: list[dict[str, dict[str, int]]] = []
-        for interface, counters in command_output["interfaceErrorCounters"].items():
-            if any(value > 0 for value in counters.values()) and all(interface not in wrong_interface for wrong_interface in wrong_interfaces):
-                wrong_interfaces.append({interface: counters})
+        wrong_interfaces: list[dict[str, dict[str, int]]] = [
+            {interface: counters} for interface, counters in command_output["interfaceErrorCounters"].items() if any(value > 0 for value in counters.values())
+        ]
         if not wrong_interfaces:
             self.result.is_success()
         else:
@@ -151,7 +174,8 @@ class VerifyInterfaceDiscards(AntaTest):
         command_output = self.instance_commands[0].json_output
         wrong_interfaces: list[dict[str, dict[str, int]]] = []
         for interface, outer_v in command_output["interfaces"].items():
-            wrong_interfaces.extend({interface: outer_v} for value in outer_v.values() if value > 0)
+            if any(value > 0 for value in outer_v.values()):
+                wrong_interfaces.append({interface: outer_v})
         if not wrong_interfaces:
             self.result.is_success()
         else:
@@ -243,7 +267,7 @@ class VerifyInterfacesStatus(AntaTest):
     @AntaTest.anta_test
     def test(self) -> None:
         """Main test function for VerifyInterfacesStatus."""
-        command_output = self.instance_commands[0].json_output
+        interface_descriptions = self.instance_commands[0].json_output["interfaceDescriptions"]
 
         self.result.is_success()
 
@@ -251,7 +275,7 @@ class VerifyInterfacesStatus(AntaTest):
         intf_wrong_state = []
 
         for interface in self.inputs.interfaces:
-            if (intf_status := get_value(command_output["interfaceDescriptions"], interface.name, separator="..")) is None:
+            if (intf_status := get_value(interface_descriptions, interface.name, separator="..")) is None:
                 intf_not_configured.append(interface.name)
                 continue
 
@@ -304,9 +328,8 @@ class VerifyStormControlDrops(AntaTest):
         storm_controlled_interfaces: dict[str, dict[str, Any]] = {}
         for interface, interface_dict in command_output["interfaces"].items():
             for traffic_type, traffic_type_dict in interface_dict["trafficTypes"].items():
-                if "drop" in traffic_type_dict and traffic_type_dict["drop"] != 0:
-                    storm_controlled_interface_dict = storm_controlled_interfaces.setdefault(interface, {})
-                    storm_controlled_interface_dict.update({traffic_type: traffic_type_dict["drop"]})
+                if drop := traffic_type_dict.get("drop", 0):
+                    storm_controlled_interfaces.setdefault(interface, {})[traffic_type] = drop
         if not storm_controlled_interfaces:
             self.result.is_success()
         else:
@@ -338,10 +361,10 @@ class VerifyPortChannels(AntaTest):
     def test(self) -> None:
         """Main test function for VerifyPortChannels."""
         command_output = self.instance_commands[0].json_output
-        po_with_inactive_ports: list[dict[str, str]] = []
+        po_with_inactive_ports: list[dict[str, dict[str, Any]]] = []
         for portchannel, portchannel_dict in command_output["portChannels"].items():
-            if len(portchannel_dict["inactivePorts"]) != 0:
-                po_with_inactive_ports.extend({portchannel: portchannel_dict["inactivePorts"]})
+            if portchannel_dict["inactivePorts"]:
+                po_with_inactive_ports.append({portchannel: portchannel_dict["inactivePorts"]})
         if not po_with_inactive_ports:
             self.result.is_success()
         else:
@@ -373,11 +396,11 @@ class VerifyIllegalLACP(AntaTest):
     def test(self) -> None:
         """Main test function for VerifyIllegalLACP."""
         command_output = self.instance_commands[0].json_output
-        po_with_illegal_lacp: list[dict[str, dict[str, int]]] = []
+        po_with_illegal_lacp: list[dict[str, str]] = []
         for portchannel, portchannel_dict in command_output["portChannels"].items():
-            po_with_illegal_lacp.extend(
-                {portchannel: interface} for interface, interface_dict in portchannel_dict["interfaces"].items() if interface_dict["illegalRxCount"] != 0
-            )
+            for interface, interface_dict in portchannel_dict["interfaces"].items():
+                if interface_dict["illegalRxCount"] != 0:
+                    po_with_illegal_lacp.append({portchannel: interface})
         if not po_with_illegal_lacp:
             self.result.is_success()
         else:
@@ -418,19 +441,18 @@ class VerifyLoopbackCount(AntaTest):
         command_output = self.instance_commands[0].json_output
         loopback_count = 0
         down_loopback_interfaces = []
-        for interface in command_output["interfaces"]:
-            interface_dict = command_output["interfaces"][interface]
-            if "Loopback" in interface:
+        for interface, interface_dict in command_output["interfaces"].items():
+            if interface.startswith("Loopback"):
                 loopback_count += 1
-                if not (interface_dict["lineProtocolStatus"] == "up" and interface_dict["interfaceStatus"] == "connected"):
+                if interface_dict["lineProtocolStatus"] != "up" or interface_dict["interfaceStatus"] != "connected":
                     down_loopback_interfaces.append(interface)
-        if loopback_count == self.inputs.number and len(down_loopback_interfaces) == 0:
+        if loopback_count == self.inputs.number and not down_loopback_interfaces:
             self.result.is_success()
         else:
             self.result.is_failure()
             if loopback_count != self.inputs.number:
                 self.result.is_failure(f"Found {loopback_count} Loopbacks when expecting {self.inputs.number}")
-            elif len(down_loopback_interfaces) != 0:  # pragma: no branch
+            elif down_loopback_interfaces:  # pragma: no branch
                 self.result.is_failure(f"The following Loopbacks are not up: {down_loopback_interfaces}")
 
 
@@ -460,11 +482,10 @@ class VerifySVI(AntaTest):
         """Main test function for VerifySVI."""
         command_output = self.instance_commands[0].json_output
         down_svis = []
-        for interface in command_output["interfaces"]:
-            interface_dict = command_output["interfaces"][interface]
-            if "Vlan" in interface and not (interface_dict["lineProtocolStatus"] == "up" and interface_dict["interfaceStatus"] == "connected"):
+        for interface, interface_dict in command_output["interfaces"].items():
+            if interface.startswith("Vlan") and (interface_dict["lineProtocolStatus"] != "up" or interface_dict["interfaceStatus"] != "connected"):
                 down_svis.append(interface)
-        if len(down_svis) == 0:
+        if not down_svis:
             self.result.is_success()
         else:
             self.result.is_failure(f"The following SVIs are not up: {down_svis}")
@@ -516,17 +537,17 @@ class VerifyL3MTU(AntaTest):
         # Parameter to save incorrect interface settings
         wrong_l3mtu_intf: list[dict[str, int]] = []
         command_output = self.instance_commands[0].json_output
-        # Set list of interfaces with specific settings
-        specific_interfaces: list[str] = []
-        if self.inputs.specific_mtu:
-            for d in self.inputs.specific_mtu:
-                specific_interfaces.extend(d)
+        # Map interfaces with specific settings to their expected MTU
+        specific_mtu = {interface: mtu for d in self.inputs.specific_mtu for interface, mtu in d.items()}
+        ignored_interfaces = frozenset(self.inputs.ignored_interfaces)
+        default_mtu = self.inputs.mtu
         for interface, values in command_output["interfaces"].items():
-            if re.findall(r"[a-z]+", interface, re.IGNORECASE)[0] not in self.inputs.ignored_interfaces and values["forwardingModel"] == "routed":
-                if interface in specific_interfaces:
-                    wrong_l3mtu_intf.extend({interface: values["mtu"]} for custom_data in self.inputs.specific_mtu if values["mtu"] != custom_data[interface])
+            if _alpha_prefix(interface) not in ignored_interfaces and values["forwardingModel"] == "routed":
+                if interface in specific_mtu:
+                    if values["mtu"] != specific_mtu[interface]:
+                        wrong_l3mtu_intf.append({interface: values["mtu"]})
                 # Comparison with generic setting
-                elif values["mtu"] != self.inputs.mtu:
+                elif values["mtu"] != default_mtu:
                     wrong_l3mtu_intf.append({interface: values["mtu"]})
         if wrong_l3mtu_intf:
             self.result.is_failure(f"Some interfaces do not have correct MTU configured:\n{wrong_l3mtu_intf}")
@@ -540,7 +561,7 @@ class VerifyIPProxyARP(AntaTest):
     Expected Results
     ----------------
     * Success: The test will pass if Proxy-ARP is enabled on the specified interface(s).
-    * Failure: The test will fail if Proxy-ARP is disabled on the specified interface(s).
+    * Failure: The test will fail if Proxy-ARP is disabled on the specified interface(s) or if an interface is not configured.
 
     Examples
     --------
@@ -556,7 +577,7 @@ class VerifyIPProxyARP(AntaTest):
     name = "VerifyIPProxyARP"
     description = "Verifies if Proxy ARP is enabled."
     categories: ClassVar[list[str]] = ["interfaces"]
-    commands: ClassVar[list[AntaCommand | AntaTemplate]] = [AntaTemplate(template="show ip interface {intf}", revision=2)]
+    commands: ClassVar[list[AntaCommand | AntaTemplate]] = [AntaCommand(command="show ip interface", revision=2)]
 
     class Input(AntaTest.Input):
         """Input model for the VerifyIPProxyARP test."""
@@ -564,22 +585,25 @@ class VerifyIPProxyARP(AntaTest):
         interfaces: list[str]
         """List of interfaces to be tested."""
 
-    def render(self, template: AntaTemplate) -> list[AntaCommand]:
-        """Render the template for each interface in the input list."""
-        return [template.render(intf=intf) for intf in self.inputs.interfaces]
-
     @AntaTest.anta_test
     def test(self) -> None:
         """Main test function for VerifyIPProxyARP."""
+        interfaces = self.instance_commands[0].json_output["interfaces"]
+        intf_not_configured = []
         disabled_intf = []
-        for command in self.instance_commands:
-            intf = command.params.intf
-            if not command.json_output["interfaces"][intf]["proxyArp"]:
+        for intf in self.inputs.interfaces:
+            if (intf_data := interfaces.get(intf)) is None:
+                intf_not_configured.append(intf)
+            elif not intf_data["proxyArp"]:
                 disabled_intf.append(intf)
+
+        self.result.is_success()
+
+        if intf_not_configured:
+            self.result.is_failure(f"The following interface(s) are not configured: {intf_not_configured}")
+
         if disabled_intf:
             self.result.is_failure(f"The following interface(s) have Proxy-ARP disabled: {disabled_intf}")
-        else:
-            self.result.is_success()
 
 
 class VerifyL2MTU(AntaTest):
@@ -628,18 +652,18 @@ class VerifyL2MTU(AntaTest):
         # Parameter to save incorrect interface settings
         wrong_l2mtu_intf: list[dict[str, int]] = []
         command_output = self.instance_commands[0].json_output
-        # Set list of interfaces with specific settings
-        specific_interfaces: list[str] = []
-        if self.inputs.specific_mtu:
-            for d in self.inputs.specific_mtu:
-                specific_interfaces.extend(d)
+        # Map interfaces with specific settings to their expected MTU
+        specific_mtu = {interface: mtu for d in self.inputs.specific_mtu for interface, mtu in d.items()}
+        ignored_interfaces = frozenset(self.inputs.ignored_interfaces)
+        default_mtu = self.inputs.mtu
         for interface, values in command_output["interfaces"].items():
-            catch_interface = re.findall(r"^[e,p][a-zA-Z]+[-,a-zA-Z]*\d+\/*\d*", interface, re.IGNORECASE)
-            if len(catch_interface) and catch_interface[0] not in self.inputs.ignored_interfaces and values["forwardingModel"] == "bridged":
-                if interface in specific_interfaces:
-                    wrong_l2mtu_intf.extend({interface: values["mtu"]} for custom_data in self.inputs.specific_mtu if values["mtu"] != custom_data[interface])
+            catch_interface = _L2_INTERFACE_RE.match(interface)
+            if catch_interface is not None and catch_interface[0] not in ignored_interfaces and values["forwardingModel"] == "bridged":
+                if interface in specific_mtu:
+                    if values["mtu"] != specific_mtu[interface]:
+                        wrong_l2mtu_intf.append({interface: values["mtu"]})
                 # Comparison with generic setting
-                elif values["mtu"] != self.inputs.mtu:
+                elif values["mtu"] != default_mtu:
                     wrong_l2mtu_intf.append({interface: values["mtu"]})
         if wrong_l2mtu_intf:
             self.result.is_failure(f"Some L2 interfaces do not have correct MTU configured:\n{wrong_l2mtu_intf}")
@@ -845,41 +869,45 @@ class VerifyInterfacesSpeed(AntaTest):
     def test(self) -> None:
         """Main test function for VerifyInterfacesSpeed."""
         self.result.is_success()
-        command_output = self.instance_commands[0].json_output
+        interfaces = self.instance_commands[0].json_output["interfaces"]
 
         # Iterate over all the interfaces
         for interface in self.inputs.interfaces:
             intf = interface.name
 
             # Check if interface exists
-            if not (interface_output := get_value(command_output, f"interfaces.{intf}")):
+            if not (interface_output := interfaces.get(intf)):
                 self.result.is_failure(f"Interface `{intf}` is not found.")
                 continue
 
-            auto_negotiation = interface_output.get("autoNegotiate")
-            actual_lanes = interface_output.get("lanes")
+            auto = interface.auto
+            lanes = interface.lanes
 
             # Collecting actual interface details
-            actual_interface_output = {
-                "auto negotiation": auto_negotiation if interface.auto is True else None,
-                "duplex mode": interface_output.get("duplex"),
-                "speed": interface_output.get("bandwidth"),
-                "lanes": actual_lanes if interface.lanes is not None else None,
-            }
+            actual_auto_negotiation = interface_output.get("autoNegotiate") if auto else None
+            actual_duplex = interface_output.get("duplex")
+            actual_speed = interface_output.get("bandwidth")
+            actual_lanes = interface_output.get("lanes") if lanes is not None else None
 
             # Forming expected interface details
+            expected_auto_negotiation = "success" if auto else None
+            expected_speed = interface.speed * BPS_GBPS_CONVERSIONS
+
+            if actual_auto_negotiation == expected_auto_negotiation and actual_duplex == "duplexFull" and actual_speed == expected_speed and actual_lanes == lanes:
+                continue
+
+            # Forming failure message, speed is converted to Gbps for readability
+            actual_interface_output = {
+                "auto negotiation": actual_auto_negotiation,
+                "duplex mode": actual_duplex,
+                "speed": f"{_to_gbps(actual_speed)}Gbps" if actual_speed is not None else None,
+                "lanes": actual_lanes,
+            }
             expected_interface_output = {
-                "auto negotiation": "success" if interface.auto is True else None,
+                "auto negotiation": expected_auto_negotiation,
                 "duplex mode": "duplexFull",
-                "speed": interface.speed * BPS_GBPS_CONVERSIONS,
-                "lanes": interface.lanes,
+                "speed": f"{_to_gbps(expected_speed)}Gbps",
+                "lanes": lanes,
             }
-
-            # Forming failure message
-            if actual_interface_output != expected_interface_output:
-                for output in [actual_interface_output, expected_interface_output]:
-                    # Convert speed to Gbps for readability
-                    if output["speed"] is not None:
-                        output["speed"] = f"{custom_division(output['speed'], BPS_GBPS_CONVERSIONS)}Gbps"
-                failed_log = get_failed_logs(expected_interface_output, actual_interface_output)
-                self.result.is_failure(f"For interface {intf}:{failed_log}\n")
+            failed_log = get_failed_logs(expected_interface_output, actual_interface_output)
+            self.result.is_failure(f"For interface {intf}:{failed_log}\n")
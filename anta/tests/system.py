@@ -264,8 +264,10 @@ class VerifyFileSystemUtilization(AntaTest):
         """Main test function for VerifyFileSystemUtilization."""
         command_output = self.instance_commands[0].text_output
         self.result.is_success()
-        for line in command_output.split("\n")[1:]:
-            if "loop" not in line and len(line) > 0 and (percentage := int(line.split()[4].replace("%", ""))) > DISK_SPACE_THRESHOLD:
+        for line in command_output.splitlines()[1:]:
+            if "loop" in line or not (fields := line.split()):
+                continue
+            if (percentage := int(fields[4].replace("%", ""))) > DISK_SPACE_THRESHOLD:
                 self.result.is_failure(f"Mount point {line} is higher than 75%: reported {percentage}%")
 
 
@@ -913,6 +913,25 @@ DATA: list[dict[str, Any]] = [
             ],
         },
     },
+    {
+        "name": "failure-multiple-counters",
+        "test": VerifyInterfaceDiscards,
+        "eos_data": [
+            {
+                "inDiscardsTotal": 42,
+                "interfaces": {
+                    "Ethernet2": {"outDiscards": 0, "inDiscards": 0},
+                    "Ethernet1": {"outDiscards": 42, "inDiscards": 42},
+                },
+                "outDiscardsTotal": 42,
+            },
+        ],
+        "inputs": None,
+        "expected": {
+            "result": "failure",
+            "messages": ["The following interfaces have non 0 discard counter(s): [{'Ethernet1': {'outDiscards': 42, 'inDiscards': 42}}]"],
+        },
+    },
     {
         "name": "success",
         "test": VerifyInterfaceErrDisabled,
@@ -1274,7 +1293,12 @@ DATA: list[dict[str, Any]] = [
             },
         ],
         "inputs": None,
-        "expected": {"result": "failure", "messages": ["The following port-channels have inactive port(s): ['Port-Channel42']"]},
+        "expected": {
+            "result": "failure",
+            "messages": [
+                "The following port-channels have inactive port(s): [{'Port-Channel42': {'Ethernet8': {'reasonUnconfigured': 'waiting for LACP response'}}}]",
+            ],
+        },
     },
     {
         "name": "success",
@@ -1673,6 +1697,38 @@ DATA: list[dict[str, Any]] = [
         "inputs": {"mtu": 1500},
         "expected": {"result": "failure", "messages": ["Some interfaces do not have correct MTU configured:\n[{'Ethernet2': 1600}]"]},
     },
+    {
+        "name": "failure-specific-mtu",
+        "test": VerifyL3MTU,
+        "eos_data": [
+            {
+                "interfaces": {
+                    "Ethernet2": {
+                        "name": "Ethernet2",
+                        "forwardingModel": "routed",
+                        "lineProtocolStatus": "up",
+                        "interfaceStatus": "connected",
+                        "hardware": "ethernet",
+                        "mtu": 1600,
+                        "l3MtuConfigured": True,
+                        "l2Mru": 0,
+                    },
+                    "Ethernet10": {
+                        "name": "Ethernet10",
+                        "forwardingModel": "routed",
+                        "lineProtocolStatus": "up",
+                        "interfaceStatus": "connected",
+                        "hardware": "ethernet",
+                        "mtu": 1500,
+                        "l3MtuConfigured": False,
+                        "l2Mru": 0,
+                    },
+                },
+            },
+        ],
+        "inputs": {"mtu": 1500, "specific_mtu": [{"Ethernet2": 1600}, {"Ethernet10": 9000}]},
+        "expected": {"result": "failure", "messages": ["Some interfaces do not have correct MTU configured:\n[{'Ethernet10': 1500}]"]},
+    },
     {
         "name": "success",
         "test": VerifyL2MTU,
@@ -1843,10 +1899,6 @@ DATA: list[dict[str, Any]] = [
                         "maxMssIngress": 0,
                         "maxMssEgress": 0,
                     },
-                },
-            },
-            {
-                "interfaces": {
                     "Ethernet2": {
                         "name": "Ethernet2",
                         "lineProtocolStatus": "up",
@@ -1899,10 +1951,6 @@ DATA: list[dict[str, Any]] = [
                         "maxMssIngress": 0,
                         "maxMssEgress": 0,
                     },
-                },
-            },
-            {
-                "interfaces": {
                     "Ethernet2": {
                         "name": "Ethernet2",
                         "lineProtocolStatus": "up",
@@ -1929,6 +1977,44 @@ DATA: list[dict[str, Any]] = [
         "inputs": {"interfaces": ["Ethernet1", "Ethernet2"]},
         "expected": {"result": "failure", "messages": ["The following interface(s) have Proxy-ARP disabled: ['Ethernet2']"]},
     },
+    {
+        "name": "failure-interface-not-configured",
+        "test": VerifyIPProxyARP,
+        "eos_data": [
+            {
+                "interfaces": {
+                    "Ethernet1": {
+                        "name": "Ethernet1",
+                        "lineProtocolStatus": "up",
+                        "interfaceStatus": "connected",
+                        "mtu": 1500,
+                        "interfaceAddressBrief": {"ipAddr": {"address": "10.1.0.0", "maskLen": 31}},
+                        "ipv4Routable240": False,
+                        "ipv4Routable0": False,
+                        "enabled": True,
+                        "description": "P2P_LINK_TO_NW-CORE_Ethernet1",
+                        "proxyArp": False,
+                        "localProxyArp": False,
+                        "gratuitousArp": False,
+                        "vrf": "default",
+                        "urpf": "disable",
+                        "addresslessForwarding": "isInvalid",
+                        "directedBroadcastEnabled": False,
+                        "maxMssIngress": 0,
+                        "maxMssEgress": 0,
+                    },
+                },
+            },
+        ],
+        "inputs": {"interfaces": ["Ethernet1", "Ethernet2"]},
+        "expected": {
+            "result": "failure",
+            "messages": [
+                "The following interface(s) are not configured: ['Ethernet2']",
+                "The following interface(s) have Proxy-ARP disabled: ['Ethernet1']",
+            ],
+        },
+    },
     {
         "name": "success",
         "test": VerifyInterfaceIPv4,